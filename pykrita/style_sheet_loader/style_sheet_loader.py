@@ -19,11 +19,26 @@
 import re
 import os.path
 import hashlib
-import xml.etree.ElementTree as ET
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from krita import Extension
 from PyQt5.QtWidgets import QFileDialog, QMessageBox, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit, QCheckBox, QApplication, QComboBox
 from PyQt5.QtGui import QPalette
-from PyQt5.QtCore import QFile, QIODevice, QMimeDatabase, QFileInfo, QDir, pyqtSignal
+from PyQt5.QtCore import QMimeDatabase, QDir, QTimer, pyqtSignal
+
+# numpy ships with some Krita builds but not all; everything works without it.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Same deal for numba: never required, but when the user's Python has it the
+# scalar color kernel below gets compiled to native code on first use.
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
 
 EXTENSION_ID = 'pykrita_style_sheet_loader'
 MENU_ENTRY = 'Load Style Sheet'
@@ -33,48 +48,185 @@ PRINT_STYLESHEET = False
 # Constant string for the config group in kritarc
 PLUGIN_CONFIG = "plugin/StyleSheetLoader"
 
+# Compiled once at import; importStylesheet is re-run on every setting toggle,
+# so don't pay for regex compilation on each reload.
+_PALETTE_RE = re.compile(r'QPalette\.(\w+)(?:\((.*?)\))?')
+_PARAM_SPLIT_RE = re.compile(r'[^a-zA-Z0-9\.-]+')
+
+# Output templates for the placeholder replacements; %-formatting with
+# precompiled templates beats building an f-string per match.
+_RGB_FMT = "rgb(%d, %d, %d)"
+_RGBA_FMT = "rgba(%d, %d, %d, %s)"
+_HSL_FMT = "hsl(%d, %d%%, %d%%)"
+_HSLA_FMT = "hsla(%d, %d%%, %d%%, %s)"
+
+# Alpha rendered once per thousandth and indexed thereafter; the opacity
+# test then becomes an integer compare against 1000 instead of a float
+# subtract-and-abs per match. Inputs are already clamped to 0..1.
+_ALPHA_STR = [f"{i / 1000:.2f}" for i in range(1001)]
+
+# Per-mode output formatters; the substitution passes pick one up front so
+# the per-match code never branches on the color mode.
+def format_rgb_color(rgb, alpha):
+    alpha_i = int(alpha * 1000 + 0.5)
+    if alpha_i >= 1000:
+        return _RGB_FMT % rgb
+    return _RGBA_FMT % (rgb[0], rgb[1], rgb[2], _ALPHA_STR[alpha_i])
+
+def format_hsl_color(hsl, alpha):
+    h, s, l = hsl
+    # Round to nearest instead of truncating, so e.g. l=99.9 emits 100
+    # rather than 99; values are already clamped to range.
+    hsl_ints = (int(h + 0.5), int(s + 0.5), int(l + 0.5))
+    alpha_i = int(alpha * 1000 + 0.5)
+    if alpha_i >= 1000:
+        return _HSL_FMT % hsl_ints
+    return _HSLA_FMT % (hsl_ints + (_ALPHA_STR[alpha_i],))
+
+@functools.lru_cache(maxsize=1024)
+def compute_palette_replacement(param_str, color_mode, base_rgb, base_hsl):
+    """Parse, compute and format one placeholder replacement.
+
+    Memoized across reloads; the base color is part of the key, so a theme
+    switch or mode change simply misses instead of needing invalidation.
+    """
+    h, s, l, a = parse_color_params(param_str) if param_str is not None else (0, 1.0, 1.0, 1.0)
+    if color_mode == "RGB":
+        color_values, alpha = calculate_color(base_rgb, color_mode, h, s, l, a)
+        return format_rgb_color(color_values, alpha)
+    # Ask for the HSL values directly; converting them to RGB only for the
+    # formatter to convert straight back would be a wasted round-trip.
+    hsl_values, alpha = calculate_color(base_rgb, color_mode, h, s, l, a,
+                                        base_hsl=base_hsl, hsl_out=True)
+    return format_hsl_color(hsl_values, alpha)
+
+# Shared QMimeDatabase, created on first use instead of per reload
+_mime_db = None
+
+def _get_mime_db():
+    global _mime_db
+    if _mime_db is None:
+        _mime_db = QMimeDatabase()
+    return _mime_db
+
+_SVG_URL_RE = re.compile(
+    r'(url\([\'"]?([^\'"\)]+\.svg)[\'"]?\))'  # Full URL and path
+    r'\s*\.\s*'  # Dot with optional whitespace
+    r'(?:'  # Non-capturing group for alternatives
+    r'QPalette\.(\w+)(?:\((.*?)\))?|'  # QPalette.Color(params)
+    r'hsla?\((.*?)\)|'  # hsl(params) or hsla(params)
+    r'rgba?\((.*?)\)'   # rgb(params) or rgba(params)
+    r')'
+)
+# Both rewrites fused into one alternation so the stylesheet is scanned a
+# single time. The SVG branch comes first (groups 1-6) so that the QPalette
+# suffix of an url(...).QPalette.X(...) expression is never matched on its
+# own; the bare placeholder uses groups 7-8.
+_COMBINED_RE = re.compile(_SVG_URL_RE.pattern + '|' + _PALETTE_RE.pattern)
+
+# style attributes in raw SVG bytes; the lookbehind keeps attributes like
+# data-style= from matching. re.S lets the value span newlines (legal in
+# XML attributes); the quote backreference still bounds the match.
+_STYLE_ATTR_RE = re.compile(rb'(?<![\w-])style\s*=\s*(["\'])(.*?)\1', re.S)
+# name: value pairs inside one style attribute, whitespace already trimmed
+# by the groups
+_STYLE_PROP_RE = re.compile(r'\s*([a-zA-Z-]+)\s*:\s*([^;]+?)\s*(?:;|$)')
+
+# Snapshot of the palette dict, keyed by QPalette.cacheKey() -- Qt bumps
+# that ID whenever the palette actually changes, so comparing it is enough
+# to reuse the dict. The SVG paths call this module function directly and
+# now get the same caching as the loader's own accessor.
+_palette_snapshot = {'key': None, 'vals': None}
+
 # Function to get RGB values from QPalette
 def get_palette_rgb_values():
     palette = QApplication.instance().palette()
-    return {
-        'Window': palette.color(QPalette.Window).getRgb()[:3],
-        'WindowText': palette.color(QPalette.WindowText).getRgb()[:3],
-        'Base': palette.color(QPalette.Base).getRgb()[:3],
-        'Text': palette.color(QPalette.Text).getRgb()[:3],
-        'Button': palette.color(QPalette.Button).getRgb()[:3],
-        'ButtonText': palette.color(QPalette.ButtonText).getRgb()[:3],
-        'Highlight': palette.color(QPalette.Highlight).getRgb()[:3],
-        'HighlightedText': palette.color(QPalette.HighlightedText).getRgb()[:3],
-        'ToolTipBase': palette.color(QPalette.ToolTipBase).getRgb()[:3],
-        'ToolTipText': palette.color(QPalette.ToolTipText).getRgb()[:3],
-        'AlternateBase': palette.color(QPalette.AlternateBase).getRgb()[:3],
-        'Link': palette.color(QPalette.Link).getRgb()[:3],
-        'LinkVisited': palette.color(QPalette.LinkVisited).getRgb()[:3]
+    key = palette.cacheKey()
+    if _palette_snapshot['key'] == key:
+        return _palette_snapshot['vals']
+
+    # QColor.rgb() hands back one 0xAARRGGBB int; unpacking it with shifts
+    # avoids the 4-tuple + slice that getRgb()[:3] allocated per role.
+    def _rgb(color):
+        v = color.rgb()
+        return ((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
+
+    vals = {
+        'Window': _rgb(palette.color(QPalette.Window)),
+        'WindowText': _rgb(palette.color(QPalette.WindowText)),
+        'Base': _rgb(palette.color(QPalette.Base)),
+        'Text': _rgb(palette.color(QPalette.Text)),
+        'Button': _rgb(palette.color(QPalette.Button)),
+        'ButtonText': _rgb(palette.color(QPalette.ButtonText)),
+        'Highlight': _rgb(palette.color(QPalette.Highlight)),
+        'HighlightedText': _rgb(palette.color(QPalette.HighlightedText)),
+        'ToolTipBase': _rgb(palette.color(QPalette.ToolTipBase)),
+        'ToolTipText': _rgb(palette.color(QPalette.ToolTipText)),
+        'AlternateBase': _rgb(palette.color(QPalette.AlternateBase)),
+        'Link': _rgb(palette.color(QPalette.Link)),
+        'LinkVisited': _rgb(palette.color(QPalette.LinkVisited))
     }
+    _palette_snapshot['key'] = key
+    _palette_snapshot['vals'] = vals
+    return vals
 
 def rgb_to_hsl(r, g, b):
     r, g, b = r/255.0, g/255.0, b/255.0
-    cmax = max(r, g, b)
-    cmin = min(r, g, b)
+    # Inline conditional expressions are cheaper than max()/min() calls here
+    cmax = r if r >= g and r >= b else (g if g >= b else b)
+    cmin = r if r <= g and r <= b else (g if g <= b else b)
     delta = cmax - cmin
 
-    # Calculate hue
+    # Calculate lightness
+    l = (cmax + cmin) / 2
+
     if delta == 0:
-        h = 0
-    elif cmax == r:
-        h = 60 * (((g - b) / delta) % 6)
-    elif cmax == g:
-        h = 60 * ((b - r) / delta + 2)
-    else:
-        h = 60 * ((r - g) / delta + 4)
+        return 0.0, 0.0, l * 100
+
+    # Tuple indexing on the max channel instead of an if/elif chain; the
+    # offsets keep each branch's value in range so one % 6 covers all three.
+    idx = 0 if cmax == r else (1 if cmax == g else 2)
+    num = (g - b, b - r, r - g)[idx]
+    off = (0.0, 2.0, 4.0)[idx]
+    h = 60 * ((num / delta + off) % 6)
+    s = delta / (1 - abs(2 * l - 1))
+    return h, s * 100, l * 100
 
-    # Calculate lightness
+# rgb_to_hsl is pure float arithmetic, so it JIT-compiles as-is; the result
+# is kept in numba's on-disk cache so the cost is paid once per machine.
+# hsl_to_rgb is wrapped further down, after its helpers are defined.
+if _njit is not None:
+    rgb_to_hsl = _njit(cache=True)(rgb_to_hsl)
+
+def rgb_to_hsl_batch(rgb_values):
+    """
+    Convert a list of (r, g, b) tuples to (h, s, l) tuples in one pass.
+    With numpy available the whole batch is converted branchlessly in C
+    (np.select over the three hue cases); otherwise fall back to the
+    scalar rgb_to_hsl per entry.
+    """
+    if np is None or len(rgb_values) < 2:
+        return [rgb_to_hsl(r, g, b) for r, g, b in rgb_values]
+
+    arr = np.asarray(rgb_values, dtype=np.float64) / 255.0
+    r, g, b = arr[:, 0], arr[:, 1], arr[:, 2]
+    cmax = arr.max(axis=1)
+    cmin = arr.min(axis=1)
+    delta = cmax - cmin
     l = (cmax + cmin) / 2
 
-    # Calculate saturation
-    s = 0 if delta == 0 else delta / (1 - abs(2 * l - 1))
+    # delta == 0 rows divide by zero inside the unselected branches; the
+    # np.select/np.where masks pick the valid value, so silence the warnings.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h = np.select(
+            [delta == 0, cmax == r, cmax == g],
+            [0.0,
+             60 * (((g - b) / delta) % 6),
+             60 * ((b - r) / delta + 2)],
+            default=60 * ((r - g) / delta + 4))
+        s = np.where(delta == 0, 0.0, delta / (1 - np.abs(2 * l - 1)))
 
-    return h, s * 100, l * 100
+    return list(zip(h.tolist(), (s * 100).tolist(), (l * 100).tolist()))
 
 def normalize_hue(h):
     # Normalize hue value to be within 0-359 range.
@@ -92,16 +244,46 @@ def clip_value(value, min_val=0, max_val=None):
     except (TypeError, ValueError):
         return min_val
 
+# Per-key value handlers for parse_color_params; a dict probe replaces the
+# if/elif ladder the parser ran per value.
+_PARAM_HANDLERS = {
+    'h': normalize_hue,
+    's': clip_value,
+    'l': clip_value,
+    'a': lambda value: clip_value(value, 0, 1),
+}
+
 def parse_color_params(param_str):
-    # Parse the color parameters string and return a dictionary of values.
-    # Initialize default values
+    # Parse the color parameters string and return an (h, s, l, a) tuple.
+    # A tuple avoids a per-match dict allocation plus four key lookups at
+    # every call site.
+    # One ':' scan instead of four per-key substring scans
+    if not param_str or ':' not in param_str:
+        return (0, 1.0, 1.0, 1.0)
+
     params = {'h': 0, 's': 1.0, 'l': 1.0, 'a': 1.0}
-    
-    if not param_str or not any(x in param_str for x in ['h:', 's:', 'l:', 'a:']):
-        return params
+
+    # Fast path for well-formed "h: 10, s: 1.4" input: plain string splits,
+    # no regex engine. Anything surprising falls through to the tolerant
+    # parser below.
+    try:
+        for kv in param_str.strip('() ').split(','):
+            key, _, value = kv.partition(':')
+            key = key.strip()
+            handler = _PARAM_HANDLERS.get(key)
+            if handler is None:
+                raise ValueError(kv)
+            # Integer literals (whole hue shifts, '1' multipliers) skip the
+            # float construction entirely
+            value = value.strip()
+            value = int(value) if value.lstrip('+-').isdigit() else float(value)
+            params[key] = handler(value)
+        return (params['h'], params['s'], params['l'], params['a'])
+    except ValueError:
+        params = {'h': 0, 's': 1.0, 'l': 1.0, 'a': 1.0}
 
     # Remove parentheses and split by any non-alphanumeric character (except . and -)
-    parts = re.split(r'[^a-zA-Z0-9\.-]+', param_str.strip('()'))
+    parts = _PARAM_SPLIT_RE.split(param_str.strip('()'))
     
     current_param = None
     for part in parts:
@@ -113,35 +295,48 @@ def parse_color_params(param_str):
             current_param = part
         elif current_param and part:
             try:
-                value = float(part)
-                if current_param == 'h':
-                    value = normalize_hue(value)
-                elif current_param == 'a':
-                    value = clip_value(value, 0, 1)
-                else:  # s and l
-                    value = clip_value(value)
-                params[current_param] = value
+                params[current_param] = _PARAM_HANDLERS[current_param](float(part))
             except ValueError:
                 continue
             current_param = None  # Reset after processing a value
-    
-    return params
 
-def calculate_color(base_rgb, color_mode="RGB", h_shift=0, s_mult=1.0, l_mult=1.0, alpha=1.0):
+    return (params['h'], params['s'], params['l'], params['a'])
+
+def calculate_color(base_rgb, color_mode="RGB", h_shift=0, s_mult=1.0, l_mult=1.0, alpha=1.0, base_hsl=None, hsl_out=False):
     # Calculate the final color based on the color mode and parameters.
+    # Bare QPalette.X references leave all modifiers at their defaults; the
+    # result is the base color, so skip the numeric round-trips entirely.
+    if h_shift == 0 and s_mult == 1.0 and l_mult == 1.0:
+        if hsl_out and color_mode != "RGB":
+            hsl = base_hsl if base_hsl is not None else rgb_to_hsl(*base_rgb)
+            return hsl, clip_value(alpha, 0, 1)
+        return tuple(base_rgb), clip_value(alpha, 0, 1)
+
     if color_mode == "RGB":
-        # In RGB mode, only use lightness multiplier
-        rgb_values = tuple(max(0, min(255, int(v * l_mult))) for v in base_rgb)
+        # In RGB mode, only use lightness multiplier. Unrolled: the generator
+        # with max()/min() per channel cost nine C calls per color.
+        r = int(base_rgb[0] * l_mult)
+        g = int(base_rgb[1] * l_mult)
+        b = int(base_rgb[2] * l_mult)
+        rgb_values = (0 if r < 0 else 255 if r > 255 else r,
+                      0 if g < 0 else 255 if g > 255 else g,
+                      0 if b < 0 else 255 if b > 255 else b)
         return rgb_values, clip_value(alpha, 0, 1)  # Ensure alpha is clipped between 0 and 1
     else:
-        # Convert to HSL, apply modifications, then convert back to RGB
-        h, s, l = rgb_to_hsl(*base_rgb)
-        
+        # Convert to HSL, apply modifications, then convert back to RGB.
+        # Callers that process many matches pass a precomputed base_hsl.
+        h, s, l = base_hsl if base_hsl is not None else rgb_to_hsl(*base_rgb)
+
         # Apply modifications
         new_h = normalize_hue(h + h_shift)
         new_s = clip_value(s * s_mult, 0, 100)
         new_l = clip_value(l * l_mult, 0, 100)
-        
+
+        # Callers emitting hsl() text take the HSL values as-is and skip
+        # the conversion back to RGB.
+        if hsl_out:
+            return (new_h, new_s, new_l), clip_value(alpha, 0, 1)
+
         # Convert back to RGB
         new_rgb = hsl_to_rgb(new_h, new_s, new_l)
         return new_rgb, clip_value(alpha, 0, 1)  # Ensure alpha is clipped between 0 and 1
@@ -163,188 +358,219 @@ def hsl_to_rgb(h, s, l):
     s = max(0, min(100, float(s))) / 100  # Convert to 0-1
     l = max(0, min(100, float(l))) / 100  # Convert to 0-1
 
-    def hue_to_rgb(p, q, t):
-        if t < 0:
-            t += 1
-        if t > 1:
-            t -= 1
-        if t < 1/6:
-            return p + (q - p) * 6 * t
-        if t < 1/2:
-            return q
-        if t < 2/3:
-            return p + (q - p) * (2/3 - t) * 6
-        return p
-
-    if s == 0:
-        # Achromatic (grey)
-        rgb = l, l, l
-    else:
-        q = l * (1 + s) if l < 0.5 else l + s - l * s
-        p = 2 * l - q
-        
-        h /= 360  # Normalize hue to 0-1
-        r = hue_to_rgb(p, q, h + 1/3)
-        g = hue_to_rgb(p, q, h)
-        b = hue_to_rgb(p, q, h - 1/3)
-        rgb = (r, g, b)
+    # Chromaticity form: one integer branch on the hue sextant replaces the
+    # three helper calls (and their float branches) of the p/q formulation.
+    c = (1 - abs(2 * l - 1)) * s
+    x = c * (1 - abs((h / 60) % 2 - 1))
+    m = l - c / 2
+    h6 = int(h // 60) % 6
+    r, g, b = ((c, x, 0.0), (x, c, 0.0), (0.0, c, x),
+               (0.0, x, c), (x, 0.0, c), (c, 0.0, x))[h6]
 
     # Convert to 8-bit values with clipping
-    return tuple(clip_color_value(x * 255) for x in rgb)
+    return (clip_color_value((r + m) * 255),
+            clip_color_value((g + m) * 255),
+            clip_color_value((b + m) * 255))
+
+# Both kernels plus their helpers are nopython-compatible now; compile them
+# when numba is around and trigger the (disk-cached) compilation at import,
+# so the first reload never pays the warmup.
+if _njit is not None:
+    clip_color_value = _njit(cache=True)(clip_color_value)
+    hsl_to_rgb = _njit(cache=True)(hsl_to_rgb)
+    rgb_to_hsl(0, 0, 0)
+    hsl_to_rgb(0.0, 0.0, 0.0)
+
+
+def _freeze_params(params):
+    # Hashable, order-independent form of a color-params dict (the 'rgb'
+    # entry may be a list); used for memo keys and cache-file names.
+    if not params:
+        return ()
+    return tuple(sorted(
+        (k, tuple(v) if isinstance(v, list) else v)
+        for k, v in params.items()))
+
+def _resolve_svg_color(base_rgb, params):
+    """Resolve the final (rgb, alpha) for one SVG.
+
+    Depends only on the base color and the parameter dict, never on the
+    individual elements, so process_svg computes it once per file instead
+    of once per style attribute."""
+    if base_rgb:
+        base_h, base_s, base_l = rgb_to_hsl(*base_rgb)
+        if params:
+            h = normalize_hue(base_h + float(params.get('h', 0)))
+            s = clip_value(base_s * float(params.get('s', 1.0)), 0, 100)
+            l = clip_value(base_l * float(params.get('l', 1.0)), 0, 100)
+        else:
+            h, s, l = base_h, base_s, base_l
+        final_rgb = hsl_to_rgb(h, s, l)
+        alpha = float(params.get('a', 1.0)) if params else 1.0
+    elif 'rgb' in params:
+        final_rgb = params['rgb']
+        alpha = params.get('a', 1.0)
+    else:
+        # Direct HSL values
+        final_rgb = hsl_to_rgb(float(params.get('h', 0)),
+                               float(params.get('s', 100)),
+                               float(params.get('l', 50)))
+        alpha = float(params.get('a', 1.0))
+    return (int(final_rgb[0]), int(final_rgb[1]), int(final_rgb[2])), alpha
+
+@functools.lru_cache(maxsize=256)
+def _resolve_svg_color_frozen(base_rgb, params_key):
+    # Memoized front-end over the frozen-params form: the same
+    # (base color, params) pair recurs across many files and reloads, and
+    # the base color in the key makes theme changes self-invalidating --
+    # the same scheme compute_palette_replacement uses.
+    return _resolve_svg_color(base_rgb, dict(params_key))
+
+@functools.lru_cache(maxsize=4096)
+def transform_svg_style(style, final_rgb, alpha):
+    """Rewrite one style attribute string to the precomputed final color.
+
+    Pure string work, memoized per distinct style string -- the common
+    case in icon SVGs where a handful of styles repeat across hundreds of
+    elements."""
+    if not style:
+        return style
+
+    # Bake the replacement strings once; the property loop then only does
+    # concatenation instead of re-formatting the same color per property
+    color_str = ': rgb(%d, %d, %d)' % final_rgb
+    opacity_str = '-opacity: %.3f' % alpha if int(alpha * 1000 + 0.5) != 1000 else None
+
+    modified_properties = []
+    # Apply colors to style properties; one C-level findall replaces the
+    # split/strip/split-again chain and its intermediate lists
+    for name, value in _STYLE_PROP_RE.findall(style):
+        if name in ('fill', 'color', 'stroke') and value.lower() != 'none':
+            modified_properties.append(name + color_str)
+            if opacity_str is not None:
+                modified_properties.append(name + opacity_str)
+        elif not name.endswith('-opacity'):
+            modified_properties.append(f"{name}: {value}")
+
+    return '; '.join(modified_properties)
 
 
 class SVGProcessor:
     def __init__(self, base_path, resource_prefix="stylesheet", search_in_stylesheet_dir=True):
         self.base_path = base_path
         self.resource_prefix = resource_prefix
+        # Prefix with the trailing colon, built once instead of per URL
+        self.prefix = resource_prefix + ':'
         self.search_in_stylesheet_dir = search_in_stylesheet_dir
         # Create temp directory for processed SVGs
         self.temp_dir = os.path.join(self.base_path, '.processed_svg')
         os.makedirs(self.temp_dir, exist_ok=True)
+        # Resolved output paths keyed by (source, mtime, color inputs), so a
+        # second reference within a load skips hashing and the exists() stat
+        self._resolved = {}
 
     def get_or_process_svg(self, svg_path, palette_color, color_params):
         """Get processed SVG path or create new processed version"""
         # Remove any existing prefix from the path
-        if svg_path.startswith(f'{self.resource_prefix}:'):
-            svg_path = svg_path[len(f'{self.resource_prefix}:'):]
-        
+        if svg_path.startswith(self.prefix):
+            svg_path = svg_path[len(self.prefix):]
+
         input_path = os.path.join(self.base_path, svg_path)
-        
-        # Create unique filename based on parameters
-        params_hash = hashlib.md5(f"{palette_color}:{color_params}".encode()).hexdigest()[:8]
+
+        base_rgb = get_palette_rgb_values()[palette_color] if palette_color else None
+        params_key = _freeze_params(color_params)
+
+        st = os.stat(input_path)
+        memo_key = (svg_path, st.st_mtime_ns, palette_color, base_rgb, params_key)
+        cached = self._resolved.get(memo_key)
+        if cached is not None:
+            return cached
+
+        # Content-addressed cache name: hashing the source bytes and the
+        # resolved base color (not just the parameter string) means editing
+        # the SVG or switching theme can never serve a stale processed file.
+        with open(input_path, 'rb') as f:
+            src_bytes = f.read()
+        # BLAKE2b is the fastest hash CPython ships; digest_size=4 gives the
+        # same 8 hex chars the old truncated md5 produced
+        hasher = hashlib.blake2b(src_bytes, digest_size=4)
+        # repr of the canonical tuple: order-stable (params_key is sorted)
+        # and unambiguous, unlike colon-joined str() fields
+        hasher.update(repr((palette_color, base_rgb, params_key)).encode())
+        params_hash = hasher.hexdigest()
         base_name = os.path.splitext(os.path.basename(svg_path))[0]
         output_filename = f"{base_name}_{params_hash}.svg"
         output_path = os.path.join(self.temp_dir, output_filename)
-        
+
         if not os.path.exists(output_path):
             self.process_svg(input_path, output_path, palette_color, color_params)
-        
+
         relative_path = os.path.relpath(output_path, self.base_path).replace("\\","/")
-        
+
         if DEBUG_MODE:
             print(f"[SVG] Processed SVG path: {relative_path}")
-            
+
+        self._resolved[memo_key] = relative_path
         return relative_path
         
 
     def process_svg(self, input_path, output_path, palette_color, color_params):
         """Process SVG file and save with modified colors"""
         try:
+            base_rgb = get_palette_rgb_values()[palette_color] if palette_color else None
+
             if DEBUG_MODE:
                 print(f"[SVG] Processing SVG file:")
                 print(f"[SVG]   Input: {input_path}")
                 print(f"[SVG]   Output: {output_path}")
                 print(f"[SVG]   Palette Color: {palette_color}")
                 if palette_color:
-                    print(f"[SVG]   Base RGB: {get_palette_rgb_values()[palette_color]}")
+                    print(f"[SVG]   Base RGB: {base_rgb}")
                 print(f"[SVG]   Color Params: {color_params}")
 
-            tree = ET.parse(input_path)
-            root = tree.getroot()
-            
-            base_rgb = get_palette_rgb_values()[palette_color] if palette_color else None
-            
-            for elem in root.iter():
-                if 'style' in elem.attrib:
-                    orig_style = elem.attrib['style']
-                    if DEBUG_MODE:
-                        print(f"[SVG]   Original style: {orig_style}")
-                    elem.attrib['style'] = self.transform_style_colors(orig_style, base_rgb, color_params)
-                    if DEBUG_MODE:
-                        print(f"[SVG]   Modified style: {elem.attrib['style']}")
+            # Only the style attributes change, so rewrite them in the raw
+            # bytes instead of building a full Element tree per file and
+            # re-serializing it; this also keeps the rest of the file
+            # byte-identical to the source.
+            with open(input_path, 'rb') as f:
+                src = f.read()
+
+            # One color resolution for the whole file; every element shares it
+            final_rgb, alpha = _resolve_svg_color_frozen(base_rgb, _freeze_params(color_params))
+
+            def rewrite(match):
+                style = match.group(2)
+                # Nothing colorable in this attribute: leave the bytes alone
+                if b'fill' not in style and b'stroke' not in style and b'color' not in style:
+                    return match.group(0)
+                new_style = transform_svg_style(style.decode('utf-8'), final_rgb, alpha)
+                quote = match.group(1)
+                return b'style=' + quote + new_style.encode('utf-8') + quote
+
+            # Write to a per-thread temp name and move it into place, so a
+            # crash mid-write (or two threads racing to the same name) can
+            # never leave a truncated file in the cache; os.replace is
+            # atomic on the same filesystem.
+            tmp_path = '%s.%x.tmp' % (output_path, threading.get_ident())
+            with open(tmp_path, 'wb') as f:
+                f.write(_STYLE_ATTR_RE.sub(rewrite, src))
+            os.replace(tmp_path, output_path)
 
-            tree.write(output_path, encoding='utf-8', xml_declaration=True)
-            
         except Exception as e:
             print(f"[SVG] Error: {e}")
             raise
 
     def transform_style_colors(self, style, base_rgb, params):
-        """Transform colors and opacity in SVG style attribute"""
-        # Early debug to verify inputs
-        print(f"[SVG Color] Starting transformation:")
-        print(f"[SVG Color] Input style: {style}")
-        print(f"[SVG Color] Base RGB: {base_rgb}")
-        print(f"[SVG Color] Parameters: {params}")
-
-        if not style:
-            return style
-
-        # Split into properties
-        properties = [p.strip() for p in style.split(';') if p.strip()]
-        modified_properties = []
-
+        """Transform colors and opacity in SVG style attribute."""
         try:
-            # Calculate final color
-            if base_rgb:
-                # Convert base color to HSL
-                base_h, base_s, base_l = rgb_to_hsl(*base_rgb)
-                print(f"[SVG Color] Base HSL: h={base_h:.1f}, s={base_s:.1f}, l={base_l:.1f}")
-
-                if params:
-                    # Get modifiers
-                    h_mod = float(params.get('h', 0))
-                    s_mod = float(params.get('s', 1.0))
-                    l_mod = float(params.get('l', 1.0))
-                    
-                    # Apply modifiers
-                    h = normalize_hue(base_h + h_mod)
-                    s = base_s * s_mod  # Multiply base saturation
-                    l = base_l * l_mod  # Multiply base lightness
-                    
-                    # Ensure valid ranges
-                    s = clip_value(s, 0, 100)
-                    l = clip_value(l, 0, 100)
-                    
-                    print(f"[SVG Color] Modified HSL: h={h:.1f}, s={s:.1f}, l={l:.1f}")
-                    print(f"[SVG Color] Applied modifiers: h+={h_mod}, s*={s_mod}, l*={l_mod}")
-                else:
-                    h, s, l = base_h, base_s, base_l
-
-                # Convert back to RGB
-                final_rgb = [int(x) for x in hsl_to_rgb(h, s, l)]
-                alpha = float(params.get('a', 1.0)) if params else 1.0
-                
-                print(f"[SVG Color] Final RGB: {final_rgb}, Alpha: {alpha}")
-            else:
-                # Direct color mode (RGB or HSL)
-                if isinstance(params, dict):
-                    if 'rgb' in params:
-                        final_rgb = params['rgb']
-                        alpha = params.get('a', 1.0)
-                    else:
-                        h = float(params.get('h', 0))
-                        s = float(params.get('s', 100))
-                        l = float(params.get('l', 50))
-                        final_rgb = [int(x) for x in hsl_to_rgb(h, s, l)]
-                        alpha = float(params.get('a', 1.0))
-
-            # Apply colors to style properties
-            for prop in properties:
-                if ':' not in prop:
-                    modified_properties.append(prop)
-                    continue
-
-                name, value = [x.strip() for x in prop.split(':', 1)]
-                
-                if name in ['fill', 'color', 'stroke'] and value.lower() != 'none':
-                    modified_properties.append(f"{name}: rgb({final_rgb[0]}, {final_rgb[1]}, {final_rgb[2]})")
-                    if abs(alpha - 1.0) > 0.001:
-                        modified_properties.append(f"{name}-opacity: {alpha:.3f}")
-                elif not name.endswith('-opacity'):
-                    modified_properties.append(f"{name}: {value}")
-
-            result = '; '.join(modified_properties)
-            print(f"[SVG Color] Final style: {result}")
-            return result
-
+            final_rgb, alpha = _resolve_svg_color_frozen(base_rgb, _freeze_params(params))
         except Exception as e:
             print(f"[SVG Color] Error during transformation: {e}")
             return style
+        return transform_svg_style(style, final_rgb, alpha)
 
 
 
-        
 class StyleSheetLoader(Extension):
     pathChanged = pyqtSignal(str)
 
@@ -357,6 +583,34 @@ class StyleSheetLoader(Extension):
         self.customResourcePrefix = Application.readSetting(PLUGIN_CONFIG, "customResourcePrefix", "stylesheet")
         self.searchInStyleSheetDir = Application.readSetting(PLUGIN_CONFIG, "useStyleSheetDirAsResourcePath", "True") == "True"
         self.base_path = None
+        # Palette lookups cross into Qt 13 times per query; cache the dict and
+        # drop it when the theme changes (see setup()).
+        self._palette_cache = None
+        self._palette_hsl_cache = None
+        # Last (prefix, paths) handed to QDir.setSearchPaths, so repeated
+        # updateResPath calls skip the Qt cross-call when nothing changed
+        self._last_searchpath = None
+        # Fully-processed stylesheets keyed by (path, mtime, colorMode,
+        # prefix, searchInStyleSheetDir); toggling a setting back and forth
+        # then reuses the result instead of re-reading and re-parsing.
+        self._processed_cache = {}
+        # Last stylesheet string handed to Qt, to skip no-op re-polishes
+        self._lastAppliedSheet = None
+        # Raw file contents keyed by path -> (mtime_ns, text); reloads only
+        # touch the disk again when the file actually changed.
+        self._raw_cache = {}
+        # Reusable warning dialog, created on first warning
+        self._warningBox = None
+        # One SVGProcessor per (base_path, prefix, searchDir) combination;
+        # the url handlers used to construct a fresh one per match
+        self._svg_processor = None
+        self._svg_processor_key = None
+        # Single-shot timer so a burst of settings changes triggers one
+        # reload instead of one per changed setting.
+        self._reloadTimer = QTimer()
+        self._reloadTimer.setSingleShot(True)
+        self._reloadTimer.setInterval(150)
+        self._reloadTimer.timeout.connect(self.lineEditImport)
         self.useAsResourcePathCheckbox = QCheckBox()
         self.updateResPath()
 
@@ -364,13 +618,42 @@ class StyleSheetLoader(Extension):
         appNotifier = Application.instance().notifier()
         appNotifier.setActive(True)
         appNotifier.windowCreated.connect(self.loadOnStartup)
+        QApplication.instance().paletteChanged.connect(self.invalidatePaletteCache)
+
+    def invalidatePaletteCache(self, *args):
+        self._palette_cache = None
+        self._palette_hsl_cache = None
+        # Replacements for the old theme would just sit in the memo as dead
+        # entries (the base color is part of the key), so drop them too.
+        compute_palette_replacement.cache_clear()
+        # Processed stylesheets bake in the old palette's colors; their cache
+        # key only covers file and settings, so flush them outright.
+        self._processed_cache.clear()
+
+    def _getSvgProcessor(self):
+        # Shared across all url() matches of a reload; rebuilt only when the
+        # stylesheet directory or resource settings change.
+        key = (self.base_path, self.customResourcePrefix, self.searchInStyleSheetDir)
+        if self._svg_processor is None or self._svg_processor_key != key:
+            self._svg_processor = SVGProcessor(self.base_path,
+                                               self.customResourcePrefix,
+                                               self.searchInStyleSheetDir)
+            self._svg_processor_key = key
+        return self._svg_processor
+
+    def getPaletteRgbValues(self):
+        if self._palette_cache is None:
+            self._palette_cache = get_palette_rgb_values()
+        return self._palette_cache
 
     def initialSetup(self):
         print("Performing initial setup...")
-        self.updateResPath()
         if self.startupStyleSheet:
             print(f"Loading startup stylesheet: {self.startupStyleSheet}")
+            # importStylesheet updates the resource path itself
             self.importStylesheet(self.startupStyleSheet, addContext=True)
+        else:
+            self.updateResPath()
         
     def createActions(self, window):
         action = window.createAction(EXTENSION_ID, MENU_ENTRY, "tools/scripts")
@@ -518,96 +801,117 @@ class StyleSheetLoader(Extension):
         try:
             self.setPath(path)
             if DEBUG_MODE:
-                print("self.setPath(path)", self.setPath(path))
+                print("self.setPath(path)")
 
             self.updateResPath()
             if DEBUG_MODE:
                 print("self.updateResPath()")
 
-            if not QFileInfo(path).exists():
+            try:
+                st = os.stat(path)
+            except OSError:
                 self.showWarningMessage(f"\"{path}\" does not exist!", addContext)
                 return
-                    
-            mimeType = QMimeDatabase().mimeTypeForFile(path)
-            if not mimeType.inherits("text/plain"):
-                self.showWarningMessage("\"%s\" does not appear to be a text file!" % (path), addContext)
+
+            cache_key = (path, st.st_mtime_ns, self.colorMode,
+                         self.customResourcePrefix, self.searchInStyleSheetDir)
+            cached = self._processed_cache.get(cache_key)
+            if cached is not None:
+                if DEBUG_MODE:
+                    print(f"[CACHE] Reusing processed stylesheet for {path}")
+                self.applyStylesheet(cached)
                 return
 
-            file = QFile(path)
-            if file.open(QIODevice.ReadOnly | QIODevice.Text):
+            cached_raw = self._raw_cache.get(path)
+            if cached_raw is not None and cached_raw[0] == st.st_mtime_ns:
+                # Unchanged on disk; the type checks already passed last time
+                stylesheet = cached_raw[1]
+            else:
+                # Known text suffixes (the file dialog filter only offers
+                # these) skip the MIME probe; others are content-sniffed.
+                if os.path.splitext(path)[1].lower() not in ('.qss', '.txt'):
+                    mimeType = _get_mime_db().mimeTypeForFile(path)
+                    if not mimeType.inherits("text/plain"):
+                        self.showWarningMessage("\"%s\" does not appear to be a text file!" % (path), addContext)
+                        return
+
+                # Read through Python's buffered I/O; no QByteArray round-trip.
                 try:
-                    # Read QByteArray data
-                    qbytearray = file.readAll()
-                    
-                    if DEBUG_MODE:
-                        print(f"[DEBUG] Raw data type: {type(qbytearray)}")
-                    
-                    # Convert QByteArray to Python string
-                    try:
-                        stylesheet = str(qbytearray, encoding='utf-8')
-                    except UnicodeDecodeError:
-                        # Fallback to system default encoding if UTF-8 fails
-                        stylesheet = str(qbytearray, encoding='ascii', errors='ignore')
-                    
-                    if DEBUG_MODE:
-                        print(f"[DEBUG] Base path: {os.path.dirname(os.path.abspath(path))}")
-                        print(f"[DEBUG] Stylesheet length: {len(stylesheet)}")
-                        print(f"[DEBUG] Stylesheet type: {type(stylesheet)}")
-                    
-                    if PRINT_STYLESHEET and DEBUG_MODE:
-                        print("\nOriginal stylesheet:")
-                        print(stylesheet[:800])  # Print first 800 chars
-                    
-                    # Update base path for SVG processing
-                    self.base_path = os.path.dirname(os.path.abspath(path))
-                    
-                    # Process SVG URLs first
-                    processed_stylesheet = self.process_svg_urls(stylesheet, self.base_path)
-                    
-                    # Then replace color placeholders
-                    final_stylesheet = self.replace_placeholders(processed_stylesheet)
-                    
-                    if PRINT_STYLESHEET:
-                        print("\nProcessed stylesheet:\n", final_stylesheet)
-                        #print(final_stylesheet[:500])  # Print first 500 chars
-                    
-                    # Apply the stylesheet
-                    active_window = Application.activeWindow()
-                    if active_window is not None and hasattr(active_window, 'qwindow'):
-                        try:
-                            active_window.qwindow().setStyleSheet(final_stylesheet)
-                        except Exception as e:
-                            print(f"Failed to set stylesheet: {e}")
-                            raise
-                    else:
-                        print("No active window available to apply stylesheet")
+                    with open(path, 'r', encoding='utf-8', errors='ignore', buffering=65536) as file:
+                        stylesheet = file.read()
+                except OSError:
+                    self.showWarningMessage("Failed to open \"%s\"." % (path), addContext)
+                    return
+                self._raw_cache[path] = (st.st_mtime_ns, stylesheet)
 
-                    
-                except Exception as e:
-                    print(f"Error processing stylesheet: {e}")
-                    raise
-                finally:
-                    file.close()
-            else:
-                self.showWarningMessage("Failed to open \"%s\"." % (path), addContext)
-                
             if DEBUG_MODE:
-                print(f"Resource paths for prefix '{self.customResourcePrefix}': {QDir.searchPaths(self.customResourcePrefix)}")
+                print(f"[DEBUG] Base path: {os.path.dirname(os.path.abspath(path))}")
+                print(f"[DEBUG] Stylesheet length: {len(stylesheet)}")
+
+            if PRINT_STYLESHEET and DEBUG_MODE:
+                print("\nOriginal stylesheet:")
+                print(stylesheet[:800])  # Print first 800 chars
+
+            # Update base path for SVG processing
+            self.base_path = os.path.dirname(os.path.abspath(path))
+
+            # Rewrite SVG urls and color placeholders in a single pass
+            final_stylesheet = self.process_stylesheet(stylesheet, self.base_path)
+
+            if DEBUG_MODE and PRINT_STYLESHEET:
+                print("\nProcessed stylesheet:\n", final_stylesheet)
+                #print(final_stylesheet[:500])  # Print first 500 chars
+
+            # Remember the result for redundant reloads (FIFO, small cap)
+            if len(self._processed_cache) >= 8:
+                self._processed_cache.pop(next(iter(self._processed_cache)))
+            self._processed_cache[cache_key] = final_stylesheet
+
+            # Apply the stylesheet
+            self.applyStylesheet(final_stylesheet)
+
+
+            if DEBUG_MODE:
+                # Report from the cached mapping rather than querying Qt again
+                paths = self._last_searchpath[1] if self._last_searchpath else ()
+                print(f"Resource paths for prefix '{self.customResourcePrefix}': {list(paths)}")
                 
         except Exception as e:
             print(f"Error importing stylesheet: {e}")
             self.showWarningMessage(f"Error loading stylesheet: {str(e)}", addContext)
 
+    def applyStylesheet(self, stylesheet):
+        # setStyleSheet makes Qt re-polish the whole widget tree; skip it
+        # when the sheet is identical to what is already applied.
+        if stylesheet == self._lastAppliedSheet:
+            if DEBUG_MODE:
+                print("[CACHE] Stylesheet unchanged, not re-applying")
+            return
+
+        active_window = Application.activeWindow()
+        if active_window is not None and hasattr(active_window, 'qwindow'):
+            try:
+                active_window.qwindow().setStyleSheet(stylesheet)
+                self._lastAppliedSheet = stylesheet
+            except Exception as e:
+                print(f"Failed to set stylesheet: {e}")
+                raise
+        else:
+            print("No active window available to apply stylesheet")
+
     def showWarningMessage(self, warning, addContext):
         if addContext:
             warning = "Style Sheet Loader Extension: " + warning
         # Add safety check here too
         active_window = Application.activeWindow()
         if active_window is not None and hasattr(active_window, 'qwindow'):
-            resultBox = QMessageBox(active_window.qwindow())
-            resultBox.setText(warning)
-            resultBox.setIcon(QMessageBox.Warning)
-            resultBox.show()
+            # Reuse one QMessageBox; error bursts (e.g. a typo'd path firing
+            # several editingFinished reloads) shouldn't allocate per dialog.
+            if self._warningBox is None:
+                self._warningBox = QMessageBox(active_window.qwindow())
+                self._warningBox.setIcon(QMessageBox.Warning)
+            self._warningBox.setText(warning)
+            self._warningBox.show()
         else:
             print(f"Warning: {warning}")
 
@@ -632,8 +936,8 @@ class StyleSheetLoader(Extension):
         self.resPrefixEdit.setEnabled(self.searchInStyleSheetDir)
 
         # Update the resource path and reload the stylesheet
-        self.lineEditImport()
-        
+        self.scheduleReload()
+
     def updateResPath(self):
         try:
             if self.searchInStyleSheetDir:
@@ -642,7 +946,7 @@ class StyleSheetLoader(Extension):
                 if current_path:
                     resource_path = os.path.dirname(current_path)
                     if os.path.exists(resource_path):
-                        QDir.setSearchPaths(self.customResourcePrefix, [resource_path])
+                        self._setSearchPaths(self.customResourcePrefix, [resource_path])
                         if DEBUG_MODE:
                             print(f"Resource path set to: {resource_path}")
                     elif DEBUG_MODE:
@@ -650,21 +954,32 @@ class StyleSheetLoader(Extension):
                 elif DEBUG_MODE:
                     print("No path available to set resource directory")
             else:
-                QDir.setSearchPaths(self.customResourcePrefix, [])
+                self._setSearchPaths(self.customResourcePrefix, [])
                 if DEBUG_MODE:
                     print("Resource paths cleared")
         except Exception as e:
             if DEBUG_MODE:
                 print(f"Error updating resource path: {e}")
-            
+
+    def _setSearchPaths(self, prefix, paths):
+        # updateResPath runs on every reload; only cross into Qt when the
+        # mapping actually changes.
+        target = (prefix, tuple(paths))
+        if target != self._last_searchpath:
+            QDir.setSearchPaths(prefix, paths)
+            self._last_searchpath = target
+
     def setResPrefix(self):
         self.customResourcePrefix = self.resPrefixEdit.text()
         # Write the updated resource prefix to settings
         Application.writeSetting(PLUGIN_CONFIG, "customResourcePrefix", self.customResourcePrefix)
-        # Update the resource path and reload the stylesheet
-        self.updateResPath()
+        # Update the resource path and reload the stylesheet; the reload
+        # updates the resource path itself, so only do it here directly
+        # when there is no stylesheet to reload.
         if self.path:
-            self.lineEditImport()
+            self.scheduleReload()
+        else:
+            self.updateResPath()
 
 
     def setColorMode(self, mode):
@@ -672,48 +987,120 @@ class StyleSheetLoader(Extension):
         Application.writeSetting(PLUGIN_CONFIG, "colorMode", mode)
         # Reload stylesheet if path exists
         if self.path:
-            self.lineEditImport()
+            self.scheduleReload()
+
+    def scheduleReload(self):
+        # Repeated starts collapse into a single timeout
+        self._reloadTimer.start()
+
+    def build_palette_tables(self):
+        """Palette RGB dict plus, in HSL mode, the matching HSL table."""
+        palette_rgb_values = self.getPaletteRgbValues()
+        if self.colorMode == "RGB":
+            return palette_rgb_values, None
+        # Convert each palette entry to HSL once per theme, not per reload;
+        # the table lives next to the RGB cache and shares its invalidation.
+        if self._palette_hsl_cache is None:
+            names = list(palette_rgb_values)
+            self._palette_hsl_cache = dict(zip(names, rgb_to_hsl_batch([palette_rgb_values[n] for n in names])))
+        return palette_rgb_values, self._palette_hsl_cache
+
+    def replace_palette_match(self, base_name, param_str, original, palette_rgb_values, palette_hsl_values):
+        """Compute the css color string for one QPalette placeholder.
+
+        The heavy lifting is memoized in compute_palette_replacement, so a
+        repeated expression is a single cache probe."""
+        base_rgb = palette_rgb_values.get(base_name)
+        if base_rgb is None:
+            return original
+
+        return compute_palette_replacement(
+            param_str,
+            self.colorMode,
+            base_rgb,
+            palette_hsl_values[base_name] if palette_hsl_values else None)
 
     def replace_placeholders(self, stylesheet):
-        palette_rgb_values = get_palette_rgb_values()
-        
-        # Pattern to match QPalette.Color with optional parameters
-        pattern = re.compile(r'QPalette\.(\w+)(?:\((.*?)\))?')
-        
+        # A plain substring scan is much cheaper than the regex pass
+        if 'QPalette.' not in stylesheet:
+            return stylesheet
+
+        palette_rgb_values, palette_hsl_values = self.build_palette_tables()
+        # Bind the method once; a LOAD_FAST per match beats a LOAD_ATTR chain
+        replace_palette = self.replace_palette_match
+
         def replace_match(match):
-            base_name = match.group(1)
-            param_str = match.group(2)  # This will be None if no parentheses
-            
-            if base_name not in palette_rgb_values:
-                return match.group(0)
-                
-            # Parse parameters if they exist, otherwise use defaults
-            params = parse_color_params(param_str) if param_str is not None else {'h': 0, 's': 1.0, 'l': 1.0, 'a': 1.0}
-            
-            # Calculate new color
-            color_values, alpha = calculate_color(
-                palette_rgb_values[base_name],
-                self.colorMode,
-                params['h'],
-                params['s'],
-                params['l'],
-                params['a']
-            )
-            
-            # Format output string
-            if self.colorMode == "RGB":
-                if abs(alpha - 1.0) < 0.001:
-                    return f"rgb({color_values[0]}, {color_values[1]}, {color_values[2]})"
-                else:
-                    return f"rgba({color_values[0]}, {color_values[1]}, {color_values[2]}, {alpha:.2f})"
-            else:
-                h, s, l = rgb_to_hsl(*color_values)
-                if abs(alpha - 1.0) < 0.001:
-                    return f"hsl({int(h)}, {int(s)}%, {int(l)}%)"
-                else:
-                    return f"hsla({int(h)}, {int(s)}%, {int(l)}%, {alpha:.2f})"
-        
-        return pattern.sub(replace_match, stylesheet)
+            return replace_palette(match.group(1), match.group(2), match.group(0),
+                                   palette_rgb_values, palette_hsl_values)
+
+        return _PALETTE_RE.sub(replace_match, stylesheet)
+
+    def process_stylesheet(self, stylesheet, base_path):
+        """Rewrite SVG urls and QPalette placeholders in one pass.
+
+        Equivalent to process_svg_urls followed by replace_placeholders,
+        but scans the stylesheet once and builds one result string instead
+        of two."""
+        if not isinstance(stylesheet, str) or not stylesheet:
+            return stylesheet
+
+        # Cheap substring scans before entering the regex engine at all
+        if 'QPalette.' not in stylesheet and '.svg' not in stylesheet:
+            return stylesheet
+
+        if not base_path:
+            # Without a base path SVG urls can't be resolved anyway
+            return self.replace_placeholders(stylesheet)
+
+        self.base_path = base_path
+        palette_rgb_values, palette_hsl_values = self.build_palette_tables()
+        # Bind both handlers once instead of a LOAD_ATTR chain per match
+        handle_svg = self.handle_svg_match
+        replace_palette = self.replace_palette_match
+
+        # SVG references mean file reads and writes; when a sheet has
+        # several distinct ones, process them side by side before the
+        # substitution pass so the I/O overlaps. Threads rather than
+        # processes: the handlers touch Qt state and the work is dominated
+        # by disk traffic, not Python arithmetic.
+        svg_results = {}
+        matches = None
+        if '.svg' in stylesheet:
+            matches = list(_COMBINED_RE.finditer(stylesheet))
+            jobs = {}
+            for m in matches:
+                if m.group(2) and m.group(0) not in jobs:
+                    jobs[m.group(0)] = m
+            if len(jobs) > 1:
+                workers = min(len(jobs), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    svg_results = dict(zip(jobs, pool.map(handle_svg, jobs.values())))
+
+        def dispatch(match):
+            # SVG branch matched (url path is group 2), else bare placeholder
+            if match.group(2):
+                done = svg_results.get(match.group(0))
+                return done if done is not None else handle_svg(match)
+            return replace_palette(match.group(7), match.group(8), match.group(0),
+                                   palette_rgb_values, palette_hsl_values)
+
+        try:
+            if matches is None:
+                return _COMBINED_RE.sub(dispatch, stylesheet)
+            # The SVG prepass already scanned the sheet; reuse its matches
+            # and join slices plus replacements once instead of paying a
+            # second regex traversal.
+            parts = []
+            last = 0
+            for m in matches:
+                parts.append(stylesheet[last:m.start()])
+                parts.append(dispatch(m))
+                last = m.end()
+            parts.append(stylesheet[last:])
+            return ''.join(parts)
+        except Exception as e:
+            print(f"[DEBUG] Error in process_stylesheet: {e}")
+            return stylesheet
 
         
     def process_svg(self, input_path, output_path, palette_color, color_params):
@@ -726,14 +1113,18 @@ class StyleSheetLoader(Extension):
             print(f"[SVG]   Color Params: {color_params}")
 
         try:
-            # Parse SVG content
+            # Parse SVG content. The import is local on purpose: ElementTree
+            # (and expat underneath) is only needed by this tree-walking
+            # path, so plugin import at Krita startup doesn't pay for it.
+            import xml.etree.ElementTree as ET
             tree = ET.parse(input_path)
             root = tree.getroot()
             
             if palette_color:
                 # Handle QPalette colors
                 base_rgb = get_palette_rgb_values()[palette_color]
-                params = parse_color_params(color_params)
+                h, s, l, a = parse_color_params(color_params)
+                params = {'h': h, 's': s, 'l': l, 'a': a}
             else:
                 # Handle direct HSL/HSLA values
                 try:
@@ -796,7 +1187,7 @@ class StyleSheetLoader(Extension):
             print(f"[DEBUG] Invalid stylesheet type in process_svg_urls: {type(stylesheet)}")
             return stylesheet
             
-        if not base_path:
+        if not base_path or '.svg' not in stylesheet:
             return stylesheet
             
         try:
@@ -804,94 +1195,107 @@ class StyleSheetLoader(Extension):
                 print(f"[DEBUG] Processing SVG URLs with base path: {base_path}")
                 
             self.base_path = base_path
-            svg_processor = SVGProcessor(
-                base_path, 
-                self.customResourcePrefix, 
-                self.searchInStyleSheetDir
-            )
-            
-            # Updated pattern to support all color formats
-            svg_pattern = re.compile(
-                r'(url\([\'"]?([^\'"\)]+\.svg)[\'"]?\))'  # Full URL and path
-                r'\s*\.\s*'  # Dot with optional whitespace
-                r'(?:'  # Non-capturing group for alternatives
-                r'QPalette\.(\w+)(?:\((.*?)\))?|'  # QPalette.Color(params)
-                r'hsla?\((.*?)\)|'  # hsl(params) or hsla(params)
-                r'rgba?\((.*?)\)'   # rgb(params) or rgba(params)
-                r')'
-            )
-            
-            def handle_svg_match(match):
-                if DEBUG_MODE:
-                    print("\n[SVG] Processing match:")
-                    print(f"[SVG] Full match: {match.group(0)}")
-                
-                url = match.group(2)
-                if not url:
-                    return match.group(0)
-                
-                try:
-                    # QPalette case
-                    if match.group(3):
-                        return self.process_qpalette(url, match.group(3), match.group(4))
-                    # HSL/HSLA case
-                    elif match.group(5):
-                        params = match.group(5)
-                        with_alpha = 'hsla' in match.group(0).lower()
-                        return self.process_hsl(url, params, with_alpha)
-                    # RGB/RGBA case
-                    elif match.group(6):
-                        params = match.group(6)
-                        with_alpha = 'rgba' in match.group(0).lower()
-                        return self.process_rgb(url, params, with_alpha)
-                except Exception as e:
-                    print(f"[SVG] Error processing match: {e}")
-                    return match.group(0)
-                
-                return match.group(0)
-            
-            return svg_pattern.sub(handle_svg_match, stylesheet)
-            
+            return _SVG_URL_RE.sub(self.handle_svg_match, stylesheet)
+
         except Exception as e:
             print(f"[DEBUG] Error in process_svg_urls: {e}")
             return stylesheet
 
+    def handle_svg_match(self, match):
+        # Groups 2-6 are the SVG branch of both _SVG_URL_RE and _COMBINED_RE.
+        if DEBUG_MODE:
+            print("\n[SVG] Processing match:")
+            print(f"[SVG] Full match: {match.group(0)}")
+
+        url = match.group(2)
+        if not url:
+            return match.group(0)
+
+        try:
+            # QPalette case
+            if match.group(3):
+                return self.process_qpalette(url, match.group(3), match.group(4))
+            # HSL/HSLA case
+            elif match.group(5):
+                params = match.group(5)
+                with_alpha = 'hsla' in match.group(0).lower()
+                return self.process_hsl(url, params, with_alpha)
+            # RGB/RGBA case
+            elif match.group(6):
+                params = match.group(6)
+                with_alpha = 'rgba' in match.group(0).lower()
+                return self.process_rgb(url, params, with_alpha)
+        except Exception as e:
+            print(f"[SVG] Error processing match: {e}")
+            return match.group(0)
+
+        return match.group(0)
+
 
     def process_qpalette(self, url, color, params):
         """Process QPalette colors"""
+        prefix = self.customResourcePrefix + ':'
+        # Local binding: these handlers run once per match, often from pool
+        # threads; a LOAD_FAST beats the global lookup per debug check
+        debug = DEBUG_MODE
         try:
-            if DEBUG_MODE:
+            if debug:
                 print(f"[QPalette] Processing: color={color}, params={params}")
                 print(f"[QPalette] Using color mode: {self.colorMode}")
             
             # Remove any existing prefix from the path
-            if url.startswith(f'{self.customResourcePrefix}:'):
-                url = url[len(f'{self.customResourcePrefix}:'):]
+            if url.startswith(prefix):
+                url = url[len(prefix):]
             
-            # Get the base RGB values from the palette
-            base_rgb = get_palette_rgb_values()[color]
+            # Get the base RGB values from the cached palette dict; the
+            # uncached fetch costs 13 Qt round-trips per url() occurrence
+            base_rgb = self.getPaletteRgbValues()[color]
             
-            if DEBUG_MODE:
+            if debug:
                 print(f"[QPalette] Base RGB from palette: {base_rgb}")
             
             # Parse parameters if provided
             if params:
                 try:
-                    # Parse parameters into a dict
-                    param_parts = re.findall(r'([hsla])\s*:\s*([-+]?\d*\.?\d+)', params)
+                    # Parse parameters into a dict; these strings are ~20
+                    # chars, so partition/float beats a regex findall for
+                    # the common comma-separated form. Space-separated
+                    # pairs ("h: 10 s: 2.4") raise out of the float() and
+                    # take the tolerant split below, mirroring
+                    # parse_color_params.
                     color_params = {}
-                    for key, value in param_parts:
-                        color_params[key] = float(value)
+                    try:
+                        for part in params.split(','):
+                            key, sep, value = part.partition(':')
+                            if not sep:
+                                continue
+                            key = key.strip()
+                            if key in ('h', 's', 'l', 'a'):
+                                color_params[key] = float(value)
+                    except ValueError:
+                        color_params = {}
+                        current_param = None
+                        for part in _PARAM_SPLIT_RE.split(params.strip('()')):
+                            if part in ('h', 's', 'l', 'a'):
+                                current_param = part
+                            elif current_param and part:
+                                try:
+                                    color_params[current_param] = float(part)
+                                except ValueError:
+                                    continue
+                                current_param = None
                     
-                    if DEBUG_MODE:
+                    if debug:
                         print(f"[QPalette] Parsed parameters: {color_params}")
                     
                     # Use the existing colorMode setting
                     modified_rgb = list(base_rgb)  # Start with base RGB
                     alpha = color_params.get('a', 1.0)  # Get alpha value early
                     
-                    if self.colorMode == 'HSL': # HSL mode processing   
-                        h, s, l = rgb_to_hsl(*base_rgb)
+                    if self.colorMode == 'HSL': # HSL mode processing
+                        # Same per-theme HSL table the placeholder path uses;
+                        # no per-match conversion
+                        h, s, l = self.build_palette_tables()[1][color]
                         
                         if 'h' in color_params:
                             h = normalize_hue(h + color_params['h'])
@@ -902,7 +1306,7 @@ class StyleSheetLoader(Extension):
                         
                         modified_rgb = [int(x) for x in hsl_to_rgb(h, s, l)]
                         
-                        if DEBUG_MODE:
+                        if debug:
                             print(f"[QPalette] HSL mode - Modified HSL: h={h:.1f}, s={s:.1f}, l={l:.1f}")
                             print(f"[QPalette] HSL mode - Modified RGB: {modified_rgb}, Alpha: {alpha}")
                     
@@ -925,7 +1329,7 @@ class StyleSheetLoader(Extension):
                         if 's' in color_params:
                             color_params.pop("s")
                         
-                        if DEBUG_MODE:
+                        if debug:
                             print(f"[QPalette] RGB mode - Modified RGB: {modified_rgb}, Alpha: {alpha}")
 
                         modified_rgb = [int(x) for x in modified_rgb]  # Ensure integer values
@@ -936,7 +1340,7 @@ class StyleSheetLoader(Extension):
                     }
                     
                 except Exception as e:
-                    if DEBUG_MODE:
+                    if debug:
                         print(f"[QPalette] Error during color processing: {e}")
                         import traceback
                         traceback.print_exc()
@@ -948,35 +1352,37 @@ class StyleSheetLoader(Extension):
             else:
                 color_params = {'rgb': base_rgb, 'a': 1.0}
                 
-            if DEBUG_MODE:
+            if debug:
                 print(f"[QPalette] Final color parameters: {color_params}")
             
-            svg_processor = SVGProcessor(
-                self.base_path,
-                self.customResourcePrefix,
-                self.searchInStyleSheetDir
-            )
+            svg_processor = self._getSvgProcessor()
             new_path = svg_processor.get_or_process_svg(url, None, color_params)
             
             if self.searchInStyleSheetDir:
-                new_path = f"{self.customResourcePrefix}:{new_path}"
+                new_path = prefix + new_path
             
             return f"url('{new_path}')"
             
         except Exception as e:
             print(f"Error in process_qpalette: {e}")
-            if not url.startswith(f"{self.customResourcePrefix}:"):
-                url = f"{self.customResourcePrefix}:{url}"
+            if not url.startswith(prefix):
+                url = prefix + url
             return f"url('{url}')"
 
 
     def process_hsl(self, url, params, with_alpha=False):
         """Process HSL/HSLA colors"""
+        prefix = self.customResourcePrefix + ':'
+        # Local binding: these handlers run once per match, often from pool
+        # threads; a LOAD_FAST beats the global lookup per debug check
+        debug = DEBUG_MODE
         try:
             # Handle both space and comma separated values
-            parts = [p.strip() for p in re.split(r'[,\s]+', params)]
-            
-            if DEBUG_MODE:
+            # Tiny inputs: replace+split does the comma/space handling
+            # without the regex engine (and drops empty tokens for free)
+            parts = params.replace(',', ' ').split()
+
+            if debug:
                 print(f"[HSL] Processing parts: {parts}")
             
             # Extract HSL and alpha values
@@ -1007,33 +1413,33 @@ class StyleSheetLoader(Extension):
                 'a': clip_value(a, 0, 1)
             }
             
-            if DEBUG_MODE:
+            if debug:
                 print(f"[HSL] Processing with params: {color_params}")
             
-            svg_processor = SVGProcessor(
-                self.base_path,
-                self.customResourcePrefix,
-                self.searchInStyleSheetDir
-            )
+            svg_processor = self._getSvgProcessor()
             new_path = svg_processor.get_or_process_svg(url, None, color_params)
             
-            if self.searchInStyleSheetDir and not new_path.startswith(f"{self.customResourcePrefix}:"):
-                new_path = f"{self.customResourcePrefix}:{new_path}"
+            if self.searchInStyleSheetDir and not new_path.startswith(prefix):
+                new_path = prefix + new_path
             
             return f"url('{new_path}')"
         except Exception as e:
             print(f"Error processing HSL/HSLA: {e}")
-            if not url.startswith(f"{self.customResourcePrefix}:"):
-                url = f"{self.customResourcePrefix}:{url}"
+            if not url.startswith(prefix):
+                url = prefix + url
             return f"url('{url}')"
 
 
     def process_rgb(self, url, params, with_alpha=False):
         """Process RGB/RGBA colors"""
+        prefix = self.customResourcePrefix + ':'
+        # Local binding: these handlers run once per match, often from pool
+        # threads; a LOAD_FAST beats the global lookup per debug check
+        debug = DEBUG_MODE
         try:
-            parts = [p.strip() for p in re.split(r'[,\s]+', params)]
-            
-            if DEBUG_MODE:
+            parts = params.replace(',', ' ').split()
+
+            if debug:
                 print(f"[RGB] Processing parts: {parts}")
             
             # Extract RGB and alpha values
@@ -1059,145 +1465,143 @@ class StyleSheetLoader(Extension):
                 'a': alpha
             }
             
-            if DEBUG_MODE:
+            if debug:
                 print(f"[RGB] Processing with params: {color_params}")
             
-            svg_processor = SVGProcessor(
-                self.base_path,
-                self.customResourcePrefix,
-                self.searchInStyleSheetDir
-            )
+            svg_processor = self._getSvgProcessor()
             new_path = svg_processor.get_or_process_svg(url, None, color_params)
             
             if self.searchInStyleSheetDir:
-                new_path = f"{self.customResourcePrefix}:{new_path}"
+                new_path = prefix + new_path
             
             return f"url('{new_path}')"
         except Exception as e:
             print(f"Error processing RGB/RGBA: {e}")
-            if not url.startswith(f"{self.customResourcePrefix}:"):
-                url = f"{self.customResourcePrefix}:{url}"
+            if not url.startswith(prefix):
+                url = prefix + url
             return f"url('{url}')"
 
 
-# Example QSS content to test
-qss_content = """
-QWidget {
-    background-color: QPalette.Window;
-    color: QPalette.WindowText(0.95, 0.3);
-    border: 1px solid QPalette.Link(0.95);
-    image: url('images/test.png');
-}
-"""
-
-# Test the replace_placeholders function
-def test_replace_placeholders():
-    loader = StyleSheetLoader(None)
-    processed_content = loader.replace_placeholders(qss_content)
-    print("Processed QSS content:\n", processed_content)
-
-
-def test_style_sheet_parser():
-    print("\nRunning style sheet parser tests...")
-    # Test cases for the stylesheet parser
-    test_cases = [
-        # Basic syntax tests
-        ("QPalette.Highlight(h: -2, s: 1.4, l: 1.04, a: 0.8)",
-         "Valid basic syntax with all parameters"),
-        
-        # Spacing variations
-        ("QPalette.Highlight(h:-2,s:1.4,l:1.04,a:0.8)",
-         "No spaces"),
-        ("QPalette.Highlight( h: -2  s: 1.4  l: 1.04  a: 0.8 )",
-         "Extra spaces"),
-        ("QPalette.Highlight(   h: -2, s: 1.4, l:1.04 , a:0.8   )",
-         "Irregular spaces"),
-        
-        # Parameter order variations
-        ("QPalette.Highlight(s: 1.4, h: -2, a: 0.8, l: 1.04)",
-         "Different parameter order"),
-        
-        # Optional parameters
-        ("QPalette.Highlight(h: -2)",
-         "Single parameter"),
-        ("QPalette.Highlight(s: 1.4, l: 1.04)",
-         "Two parameters"),
-        ("QPalette.Highlight()",
-         "No parameters"),
-        
-        # Value range tests
-        ("QPalette.Highlight(h: 850)",
-         "Hue > 359"),
-        ("QPalette.Highlight(h: -900)",
-         "Negative hue"),
-        ("QPalette.Highlight(s: 2.5)",
-         "Saturation > 1"),
-        ("QPalette.Highlight(s: -0.5)",
-         "Negative saturation"),
-        ("QPalette.Highlight(a: 1.5)",
-         "Alpha > 1"),
-        
-        # Edge cases
-        ("QPalette.Highlight(h: 0, s: 0, l: 0, a: 0)",
-         "Zero values"),
-        ("QPalette.Highlight(h:,s:,l:,a:)",
-         "Empty values"),
-        ("QPalette.Highlight(invalid)",
-         "Invalid content"),
-    ]
-
-    test_qss = """
+# Everything below only exists when this file is run as a script; Krita
+# imports the module on every startup and should not compile or keep the
+# test fixtures around.
+if __name__ == "__main__":
+    # Example QSS content to test
+    qss_content = """
     QWidget {
-        background-color: %s;
+        background-color: QPalette.Window;
+        color: QPalette.WindowText(0.95, 0.3);
+        border: 1px solid QPalette.Link(0.95);
+        image: url('images/test.png');
     }
     """
 
-    for test_case, description in test_cases:
-        print(f"\nTesting: {description}")
-        print(f"Input: {test_case}")
-        qss = test_qss % test_case
-        # Create a StyleSheetLoader instance and process the stylesheet
+    # Test the replace_placeholders function
+    def test_replace_placeholders():
         loader = StyleSheetLoader(None)
-        result = loader.replace_placeholders(qss)
-        print(f"Output: {result}")
-
-# Function to test specific color transformations
-def test_color_transformations():
-    print("\nRunning color transformation tests...")
-    test_colors = [
-        # Test extreme hue wrapping
-        {"h": 720, "s": 1.0, "l": 1.0},  # Should wrap to 0
-        {"h": -180, "s": 1.0, "l": 1.0}, # Should become 180
+        processed_content = loader.replace_placeholders(qss_content)
+        print("Processed QSS content:\n", processed_content)
+
+
+    def test_style_sheet_parser():
+        print("\nRunning style sheet parser tests...")
+        # Test cases for the stylesheet parser
+        test_cases = [
+            # Basic syntax tests
+            ("QPalette.Highlight(h: -2, s: 1.4, l: 1.04, a: 0.8)",
+             "Valid basic syntax with all parameters"),
+        
+            # Spacing variations
+            ("QPalette.Highlight(h:-2,s:1.4,l:1.04,a:0.8)",
+             "No spaces"),
+            ("QPalette.Highlight( h: -2  s: 1.4  l: 1.04  a: 0.8 )",
+             "Extra spaces"),
+            ("QPalette.Highlight(   h: -2, s: 1.4, l:1.04 , a:0.8   )",
+             "Irregular spaces"),
+        
+            # Parameter order variations
+            ("QPalette.Highlight(s: 1.4, h: -2, a: 0.8, l: 1.04)",
+             "Different parameter order"),
+        
+            # Optional parameters
+            ("QPalette.Highlight(h: -2)",
+             "Single parameter"),
+            ("QPalette.Highlight(s: 1.4, l: 1.04)",
+             "Two parameters"),
+            ("QPalette.Highlight()",
+             "No parameters"),
+        
+            # Value range tests
+            ("QPalette.Highlight(h: 850)",
+             "Hue > 359"),
+            ("QPalette.Highlight(h: -900)",
+             "Negative hue"),
+            ("QPalette.Highlight(s: 2.5)",
+             "Saturation > 1"),
+            ("QPalette.Highlight(s: -0.5)",
+             "Negative saturation"),
+            ("QPalette.Highlight(a: 1.5)",
+             "Alpha > 1"),
+        
+            # Edge cases
+            ("QPalette.Highlight(h: 0, s: 0, l: 0, a: 0)",
+             "Zero values"),
+            ("QPalette.Highlight(h:,s:,l:,a:)",
+             "Empty values"),
+            ("QPalette.Highlight(invalid)",
+             "Invalid content"),
+        ]
+
+        test_qss = """
+        QWidget {
+            background-color: %s;
+        }
+        """
+
+        for test_case, description in test_cases:
+            print(f"\nTesting: {description}")
+            print(f"Input: {test_case}")
+            qss = test_qss % test_case
+            # Create a StyleSheetLoader instance and process the stylesheet
+            loader = StyleSheetLoader(None)
+            result = loader.replace_placeholders(qss)
+            print(f"Output: {result}")
+
+    # Function to test specific color transformations
+    def test_color_transformations():
+        print("\nRunning color transformation tests...")
+        test_colors = [
+            # Test extreme hue wrapping
+            {"h": 720, "s": 1.0, "l": 1.0},  # Should wrap to 0
+            {"h": -180, "s": 1.0, "l": 1.0}, # Should become 180
         
-        # Test saturation clipping
-        {"h": 0, "s": 2.0, "l": 1.0},    # Should clip to 100%
-        {"h": 0, "s": -0.5, "l": 1.0},   # Should clip to 0%
+            # Test saturation clipping
+            {"h": 0, "s": 2.0, "l": 1.0},    # Should clip to 100%
+            {"h": 0, "s": -0.5, "l": 1.0},   # Should clip to 0%
         
-        # Test lightness variations
-        {"h": 0, "s": 1.0, "l": 1.5},    # 150% lightness
-        {"h": 0, "s": 1.0, "l": 0.5},    # 50% lightness
+            # Test lightness variations
+            {"h": 0, "s": 1.0, "l": 1.5},    # 150% lightness
+            {"h": 0, "s": 1.0, "l": 0.5},    # 50% lightness
         
-        # Test alpha variations
-        {"h": 0, "s": 1.0, "l": 1.0, "a": 0.5},  # 50% opacity
-        {"h": 0, "s": 1.0, "l": 1.0, "a": 1.5},  # Should clip to 1.0
-    ]
-
-    base_color = (255, 0, 0)  # Pure red as base color
-    for params in test_colors:
-        print("\nTesting color transformation:")
-        print(f"Input parameters: {params}")
-        h_shift = params.get("h", 0)
-        s_mult = params.get("s", 1.0)
-        l_mult = params.get("l", 1.0)
-        alpha = params.get("a", 1.0)
+            # Test alpha variations
+            {"h": 0, "s": 1.0, "l": 1.0, "a": 0.5},  # 50% opacity
+            {"h": 0, "s": 1.0, "l": 1.0, "a": 1.5},  # Should clip to 1.0
+        ]
+
+        base_color = (255, 0, 0)  # Pure red as base color
+        for params in test_colors:
+            print("\nTesting color transformation:")
+            print(f"Input parameters: {params}")
+            h_shift = params.get("h", 0)
+            s_mult = params.get("s", 1.0)
+            l_mult = params.get("l", 1.0)
+            alpha = params.get("a", 1.0)
         
-        # Test both RGB and HSL modes
-        for mode in ["HSL", "RGB"]:
-            result = calculate_color(base_color, mode, h_shift, s_mult, l_mult, alpha)
-            print(f"{mode} mode result: {result}")
+            # Test both RGB and HSL modes
+            for mode in ["HSL", "RGB"]:
+                result = calculate_color(base_color, mode, h_shift, s_mult, l_mult, alpha)
+                print(f"{mode} mode result: {result}")
 
-# Run the tests
-if DEBUG_MODE:
     test_replace_placeholders()
     test_style_sheet_parser()
     test_color_transformations()